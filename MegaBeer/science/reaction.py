@@ -21,7 +21,47 @@ class RateEquations(object):
             return lambda t: A0 * np.exp(-k * t)
 
         g = 1. - float(n) # Convert to float.
+
+        # For n < 1 the reactant is fully depleted at t = A0**g / (g * k),
+        # so clip the base at zero rather than raising it to a fractional power.
+        if g > 0.:
+            return lambda t: np.maximum(A0**g - g * k * t, 0.)**(1. / g)
+
         return lambda t: (A0**g - g * k * t)**(1. / g)
+
+    @staticmethod
+    def order_n_batch(n, k, A0, t):
+        """ Vectorized n order rate equation integral.  Evaluates many
+            reactions in a single pass instead of building one closure
+            per reaction with order_n.  Arguments are broadcast against
+            each other, so e.g. n, k, and A0 of shape (m, 1) and t of
+            shape (p,) give an (m, p) result.
+        Args:
+            n (float or numpy.ndarray): Order of reactions.
+            k (float or numpy.ndarray): Rate constants.
+            A0 (float or numpy.ndarray): Starting amounts.
+            t (float or numpy.ndarray): Times.
+        
+        Returns:
+            numpy.ndarray: Remaining amounts
+        """
+        n, k, A0, t = np.broadcast_arrays(
+            *(np.asarray(x, dtype=float) for x in (n, k, A0, t))
+        )
+        A = np.empty(n.shape)
+
+        # Order one reactions are exponential decays:
+        first = n == 1.
+        A[first] = A0[first] * np.exp(-k[first] * t[first])
+
+        # General order, clipping depleted n < 1 reactions to zero:
+        other = ~first
+        g = 1. - n[other]
+        base = A0[other]**g - g * k[other] * t[other]
+        base = np.where(g > 0., np.maximum(base, 0.), base)
+        A[other] = base**(1. / g)
+
+        return A
     
     @staticmethod
     def dkn_dt(n, k):